@@ -24,3 +24,17 @@ class ProtocolAdapter(ABC):
     def write_bulk_data(self, array_data: List[Any]) -> Tuple[Dict, float]:
         """Write an entire array of bulk data."""
         pass
+
+    def write_many(self, ops: List[Tuple[str, Any]]) -> Tuple[Dict, float]:
+        """Write several (var, value) pairs, return response and total latency in ms.
+
+        Default implementation issues one write per pair; adapters whose
+        protocol supports batching should override this with a single request.
+        """
+        total_latency = 0.0
+        responses = []
+        for var, value in ops:
+            response, latency = self.write(var, value)
+            responses.append(response)
+            total_latency += latency
+        return {"responses": responses}, total_latency
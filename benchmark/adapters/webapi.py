@@ -1,4 +1,6 @@
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import urllib3
 import time
 import os
@@ -23,8 +25,42 @@ class SpsWebApiAdapter(ProtocolAdapter):
         self.token = None
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+        self.session = self._build_session()
+
+        # Constant part of the single-write JSON-RPC envelope, serialized
+        # once; write() only encodes the varying params object
+        self._write_prefix = (
+            b'[{"jsonrpc":"2.0","method":"PlcProgram.Write","id":1,"params":'
+        )
+
+    def _build_session(self):
+        """Create the pooled HTTP client used for all requests.
+
+        One session keeps the TCP+TLS connection alive across requests
+        instead of paying a full handshake per operation.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.verify = False
+        session.headers.update({"Content-Type": "application/json"})
+        return session
+
+    def _post(self, payload, timeout: int, authenticated: bool = True):
+        """POST a JSON-RPC payload (object or pre-serialized bytes)"""
+        if authenticated and not self.token:
+            raise Exception("Not connected (missing token)")
+        body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+        return self.session.post(self.base_url, data=body, timeout=timeout)
+
     def connect(self) -> None:
         """Login and store authentication token"""
+        # disconnect() closes the session, and a closed httpx.Client
+        # cannot be reused; start every connect from a fresh session so
+        # reconnecting works for both HTTP stacks
+        self.session.close()
+        self.session = self._build_session()
         payload = [
             {
                 "id": 0,
@@ -33,13 +69,10 @@ class SpsWebApiAdapter(ProtocolAdapter):
                 "params": {"user": self.username, "password": self.password},
             }
         ]
-        headers = {"Content-Type": "application/json"}
-        response = requests.post(
-            self.base_url, json=payload, headers=headers, verify=False, timeout=10
-        )
+        response = self._post(payload, timeout=10, authenticated=False)
         response.raise_for_status()
 
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
 
         # Handle both array and object responses
         if isinstance(json_response, list) and len(json_response) > 0:
@@ -56,6 +89,9 @@ class SpsWebApiAdapter(ProtocolAdapter):
             raise Exception(f"Unexpected response format: {json_response}")
 
         self.token = result_obj["result"]["token"]
+        # The token rides on the session headers from here on, so the
+        # per-request header dict build disappears from the hot path
+        self.session.headers["X-Auth-Token"] = self.token
         print(f"✓ WebAPI connected (token: {self.token[:20]}...)")
 
     def disconnect(self) -> None:
@@ -63,41 +99,50 @@ class SpsWebApiAdapter(ProtocolAdapter):
         if not self.token:
             return
         payload = [{"jsonrpc": "2.0", "method": "Api.Logout", "id": 0}]
-        headers = {"X-Auth-Token": self.token, "Content-Type": "application/json"}
         try:
-            requests.post(
-                self.base_url, json=payload, headers=headers, verify=False, timeout=10
-            )
+            self._post(payload, timeout=10)
         finally:
             self.token = None
+            self.session.headers.pop("X-Auth-Token", None)
+            self.session.close()
             print("✓ WebAPI disconnected")
 
-    def _headers(self) -> Dict[str, str]:
-        if not self.token:
-            raise Exception("Not connected (missing token)")
-        return {"X-Auth-Token": self.token, "Content-Type": "application/json"}
+    def write(self, var: str, value: Any, parse: bool = False) -> Tuple[Dict, float]:
+        # Splice the varying params into the cached envelope instead of
+        # rebuilding and re-serializing the full payload per call
+        body = self._write_prefix + orjson.dumps({"var": var, "value": value}) + b"}]"
+        start = time.perf_counter_ns()
+        response = self._post(body, timeout=10)
+        latency = (time.perf_counter_ns() - start) / 1e6
+        # The benchmarks only use the latency; decoding the echoed JSON is
+        # pure overhead unless the caller asks for it
+        if parse:
+            return orjson.loads(response.content), latency
+        return {"status": response.status_code}, latency
 
-    def write(self, var: str, value: Any) -> Tuple[Dict, float]:
+    def write_many(
+        self, ops: List[Tuple[str, Any]], parse: bool = False
+    ) -> Tuple[Dict, float]:
+        """Write several values in one JSON-RPC 2.0 batch request."""
         payload = [
             {
                 "jsonrpc": "2.0",
                 "method": "PlcProgram.Write",
-                "id": 1,
+                "id": i,
                 "params": {"var": var, "value": value},
             }
+            for i, (var, value) in enumerate(ops)
         ]
-        start = time.time()
-        response = requests.post(
-            self.base_url,
-            json=payload,
-            headers=self._headers(),
-            verify=False,
-            timeout=10,
-        )
-        latency = (time.time() - start) * 1000
-        return response.json(), latency
+        start = time.perf_counter_ns()
+        response = self._post(payload, timeout=10)
+        latency = (time.perf_counter_ns() - start) / 1e6
+        if parse:
+            return orjson.loads(response.content), latency
+        return {"status": response.status_code}, latency
 
-    def write_bulk_data(self, array_data: List[Any]) -> Tuple[Dict, float]:
+    def write_bulk_data(
+        self, array_data: List[Any], parse: bool = False
+    ) -> Tuple[Dict, float]:
         payload = [
             {
                 "jsonrpc": "2.0",
@@ -109,13 +154,41 @@ class SpsWebApiAdapter(ProtocolAdapter):
                 },
             }
         ]
-        start = time.time()
-        response = requests.post(
-            self.base_url,
-            json=payload,
-            headers=self._headers(),
+        start = time.perf_counter_ns()
+        response = self._post(payload, timeout=30)
+        latency = (time.perf_counter_ns() - start) / 1e6
+        # The echoed BulkData array is ~3 kB of JSON nobody inspects
+        if parse:
+            return orjson.loads(response.content), latency
+        return {"status": response.status_code}, latency
+
+
+class SpsWebApiHttp2Adapter(SpsWebApiAdapter):
+    """WebAPI adapter that multiplexes requests over one HTTP/2 connection.
+
+    HTTP/1.1 keep-alive still serves one request per connection at a time;
+    HTTP/2 lets many in-flight JSON-RPCs share a single TCP+TLS connection,
+    which suits the concurrent benchmarks. Requires the optional
+    httpx[http2] package and an S7 firmware whose WebAPI speaks HTTP/2.
+    """
+
+    def _build_session(self):
+        try:
+            import httpx
+        except ImportError as e:
+            raise Exception(
+                "SpsWebApiHttp2Adapter requires the optional 'httpx[http2]' package"
+            ) from e
+        return httpx.Client(
+            http2=True,
             verify=False,
-            timeout=30,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=1, max_connections=32),
+            headers={"Content-Type": "application/json"},
         )
-        latency = (time.time() - start) * 1000
-        return response.json(), latency
+
+    def _post(self, payload, timeout: int, authenticated: bool = True):
+        if authenticated and not self.token:
+            raise Exception("Not connected (missing token)")
+        body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+        return self.session.post(self.base_url, content=body, timeout=timeout)
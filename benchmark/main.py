@@ -1,11 +1,9 @@
 from adapters.webapi import SpsWebApiAdapter
 from adapters.opcua import OpcUaAdapter
 from adapters.s7 import S7Adapter
-from benchmark_runner import BenchmarkRunner
+from benchmark_runner import BenchmarkRunner, plot_grouped_bars
 from datetime import datetime
 from dotenv import load_dotenv
-import matplotlib.pyplot as plt
-import numpy as np
 import os
 
 load_dotenv()
@@ -15,6 +13,12 @@ BENCHMARK_DURATION = int(os.getenv("BENCHMARK_DURATION_SECONDS", "5"))
 BENCHMARK_RATES = [int(r) for r in os.getenv("BENCHMARK_TARGET_RATES", "1,10,20").split(",")]
 BENCHMARK_BULK_REPS = int(os.getenv("BENCHMARK_BULK_REPETITIONS", "10"))
 
+# Run the protocol benchmarks concurrently instead of back-to-back.
+# Only meaningful if the PLC serves its WebAPI/OPC UA/S7 stacks
+# independently - otherwise the protocols contend and the numbers
+# measure fairness, not isolation.
+BENCHMARK_PARALLEL = os.getenv("BENCHMARK_PARALLEL", "0") == "1"
+
 
 def run_benchmark_for_adapter(adapter_name: str, adapter, output_dir: str):
     """Run benchmarks for a single adapter and save results"""
@@ -22,9 +26,12 @@ def run_benchmark_for_adapter(adapter_name: str, adapter, output_dir: str):
     print(f"BENCHMARKING: {adapter_name}")
     print(f"{'=' * 60}")
 
+    # Adapter-specific output directory; also receives raw latency logs
+    adapter_output = os.path.join(output_dir, adapter_name.lower().replace(" ", "_"))
+
     try:
         adapter.connect()
-        runner = BenchmarkRunner(adapter)
+        runner = BenchmarkRunner(adapter, raw_log_dir=adapter_output)
 
         # Test 1: Single writes
         print("\nStarting Single Write Benchmarks...")
@@ -65,10 +72,6 @@ def run_benchmark_for_adapter(adapter_name: str, adapter, output_dir: str):
         # Summary & Reports
         runner.print_summary()
 
-        # Create adapter-specific output directory
-        adapter_output = os.path.join(
-            output_dir, adapter_name.lower().replace(" ", "_")
-        )
         runner.export_results_json(
             os.path.join(adapter_output, "benchmark_results.json")
         )
@@ -94,6 +97,13 @@ def generate_comparison_plots(all_results: list, output_dir: str):
         all_results: List of tuples (protocol_name, results_list)
         output_dir: Directory to save the plots
     """
+    # Deferred imports: plotting is the only consumer of matplotlib
+    # here, and the headless Agg backend skips GUI toolkit probing
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     # Filter out protocols with no results
     valid_results = [(name, results) for name, results in all_results if results]
 
@@ -106,95 +116,60 @@ def generate_comparison_plots(all_results: list, output_dir: str):
     # Get all unique test names from first protocol
     test_names = [r.test_name for r in valid_results[0][1]]
 
-    # --- Plot 1: Latency P50 Comparison (Log Scale) ---
-    fig, ax = plt.subplots(figsize=(12, 6))
-    x = np.arange(len(test_names))
-    width = 0.25
-
-    all_latencies = []
-    for i, (proto_name, results) in enumerate(valid_results):
-        latencies = []
-        for test_name in test_names:
-            match = next((r for r in results if r.test_name == test_name), None)
-            lat = (
-                match.latency_p50_ms if match and match.latency_p50_ms > 0 else 0.1
-            )  # Avoid log(0)
-            latencies.append(lat)
-            all_latencies.append(lat)
-
-        offset = (i - len(valid_results) / 2 + 0.5) * width
-        bars = ax.bar(
-            x + offset,
-            latencies,
-            width,
-            label=proto_name,
-            color=colors[i % len(colors)],
+    # O(1) result lookup per (protocol, test) instead of a linear scan
+    by_name = [(name, {r.test_name: r for r in rs}) for name, rs in valid_results]
+
+    # Both comparisons share one figure: a single Agg render + PNG
+    # encode instead of two, and dpi 100 keeps the file cheap
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 12))
+    x_labels = [t.replace("_", "\n") for t in test_names]
+    proto_colors = [colors[i % len(colors)] for i in range(len(by_name))]
+
+    # Panel 1: Latency P50 per protocol (log scale, lower is better)
+    latency_series = [
+        (
+            proto_name,
+            [
+                r.latency_p50_ms if (r := results.get(t)) and r.latency_p50_ms > 0 else 0.1
+                for t in test_names
+            ],  # 0.1 floor avoids log(0)
         )
-
-        # Add value labels on bars
-        for bar, val in zip(bars, latencies):
-            if val > 0.1:
-                ax.annotate(
-                    f"{val:.1f}",
-                    xy=(bar.get_x() + bar.get_width() / 2, bar.get_height()),
-                    ha="center",
-                    va="bottom",
-                    fontsize=8,
-                    rotation=45,
-                )
-
-    ax.set_xlabel("Benchmark Test")
-    ax.set_ylabel("Latency P50 (ms)")
-    ax.set_title("Latency Comparison (P50) - Lower is Better")
-    ax.set_xticks(x)
-    ax.set_xticklabels([t.replace("_", "\n") for t in test_names], fontsize=9)
-    ax.set_yscale("log")  # Use log scale for better visibility
-    ax.legend()
-    ax.grid(axis="y", alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "comparison_latency.png"), dpi=150)
-    plt.close()
-
-    # --- Plot 2: Operations Per Second Comparison (Log Scale) ---
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    for i, (proto_name, results) in enumerate(valid_results):
-        ops_list = []
-        for test_name in test_names:
-            match = next((r for r in results if r.test_name == test_name), None)
-            ops = match.ops_per_second if match and match.ops_per_second > 0 else 0.1
-            ops_list.append(ops)
-
-        offset = (i - len(valid_results) / 2 + 0.5) * width
-        bars = ax.bar(
-            x + offset, ops_list, width, label=proto_name, color=colors[i % len(colors)]
+        for proto_name, results in by_name
+    ]
+    plot_grouped_bars(
+        ax1,
+        x_labels,
+        latency_series,
+        proto_colors,
+        ylabel="Latency P50 (ms)",
+        title="Latency Comparison (P50) - Lower is Better",
+    )
+
+    # Panel 2: Throughput per protocol (log scale, higher is better)
+    ops_series = [
+        (
+            proto_name,
+            [
+                r.ops_per_second if (r := results.get(t)) and r.ops_per_second > 0 else 0.1
+                for t in test_names
+            ],
         )
+        for proto_name, results in by_name
+    ]
+    plot_grouped_bars(
+        ax2,
+        x_labels,
+        ops_series,
+        proto_colors,
+        ylabel="Operations per Second",
+        title="Throughput Comparison - Higher is Better",
+    )
 
-        # Add value labels on bars
-        for bar, val in zip(bars, ops_list):
-            if val > 0.1:
-                ax.annotate(
-                    f"{val:.1f}",
-                    xy=(bar.get_x() + bar.get_width() / 2, bar.get_height()),
-                    ha="center",
-                    va="bottom",
-                    fontsize=8,
-                    rotation=45,
-                )
-
-    ax.set_xlabel("Benchmark Test")
-    ax.set_ylabel("Operations per Second")
-    ax.set_title("Throughput Comparison - Higher is Better")
-    ax.set_xticks(x)
-    ax.set_xticklabels([t.replace("_", "\n") for t in test_names], fontsize=9)
-    ax.set_yscale("log")  # Use log scale for better visibility
-    ax.legend()
-    ax.grid(axis="y", alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "comparison_ops.png"), dpi=150)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, "comparison_plots.png"), dpi=100)
+    plt.close(fig)
 
-    print("✓ Comparison plots saved: comparison_latency.png, comparison_ops.png")
+    print("✓ Comparison plots saved: comparison_plots.png")
 
 
 def generate_comparison_report(all_results: list, output_dir: str):
@@ -214,103 +189,99 @@ def generate_comparison_report(all_results: list, output_dir: str):
     report_path = os.path.join(output_dir, "protocol_comparison.txt")
     protocol_names = [name for name, _ in valid_results]
 
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write("PROTOCOL COMPARISON REPORT\n")
-        f.write("=" * 100 + "\n\n")
-        f.write(f"Protocols Tested: {', '.join(protocol_names)}\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("-" * 100 + "\n\n")
-
-        # Get all unique test names from first protocol
-        first_protocol_results = valid_results[0][1]
-
-        for test_result in first_protocol_results:
-            test_name = test_result.test_name
-
-            # Collect matching results from all protocols
-            matching_results = []
-            for proto_name, proto_results in valid_results:
-                match = next(
-                    (r for r in proto_results if r.test_name == test_name), None
+    # O(1) result lookup per (protocol, test) instead of a linear scan
+    by_name = [(name, {r.test_name: r for r in rs}) for name, rs in valid_results]
+
+    import numpy as np
+
+    # Rectangular (protocol, test, metric) grid over the tests every
+    # protocol ran; winner selection becomes one argmin/argmax reduction
+    # per metric column instead of per-test Python max()/min() scans
+    common_tests = [
+        r.test_name
+        for r in valid_results[0][1]
+        if all(r.test_name in d for _, d in by_name[1:])
+    ]
+    arr = np.array(
+        [
+            [
+                (
+                    d[t].ops_per_second,
+                    d[t].latency_p50_ms,
+                    d[t].latency_p90_ms,
+                    d[t].latency_p99_ms,
+                    d[t].throughput_kbps,
                 )
-                if match:
-                    matching_results.append((proto_name, match))
-
-            if len(matching_results) < 2:
-                continue
-
-            f.write(f"Test: {test_name}\n")
-            f.write("-" * 100 + "\n")
-
-            # Build dynamic header based on protocols
-            header = f"{'Metric':<25}"
-            for proto_name, _ in matching_results:
-                header += f" {proto_name:<15}"
-            header += f" {'Winner':<10}\n"
-            f.write(header)
-            f.write("-" * 100 + "\n")
-
-            # Operations per second (higher is better)
-            ops_values = [(name, r.ops_per_second) for name, r in matching_results]
-            winner_ops = max(ops_values, key=lambda x: x[1])[0]
-            line = f"{'Ops/sec':<25}"
-            for _, r in matching_results:
-                line += f" {r.ops_per_second:<15.2f}"
-            line += f" {winner_ops:<10}\n"
-            f.write(line)
-
-            # Latency P50 (lower is better)
-            p50_values = [(name, r.latency_p50_ms) for name, r in matching_results]
-            # Filter out zero values when determining winner
-            non_zero_p50 = [(n, v) for n, v in p50_values if v > 0]
-            winner_p50 = (
-                min(non_zero_p50, key=lambda x: x[1])[0] if non_zero_p50 else "N/A"
-            )
-            line = f"{'Latency P50 (ms)':<25}"
-            for _, r in matching_results:
-                line += f" {r.latency_p50_ms:<15.2f}"
-            line += f" {winner_p50:<10}\n"
-            f.write(line)
-
-            # Latency P90 (lower is better)
-            p90_values = [(name, r.latency_p90_ms) for name, r in matching_results]
-            non_zero_p90 = [(n, v) for n, v in p90_values if v > 0]
-            winner_p90 = (
-                min(non_zero_p90, key=lambda x: x[1])[0] if non_zero_p90 else "N/A"
-            )
-            line = f"{'Latency P90 (ms)':<25}"
-            for _, r in matching_results:
-                line += f" {r.latency_p90_ms:<15.2f}"
-            line += f" {winner_p90:<10}\n"
-            f.write(line)
-
-            # Latency P99 (lower is better)
-            p99_values = [(name, r.latency_p99_ms) for name, r in matching_results]
-            non_zero_p99 = [(n, v) for n, v in p99_values if v > 0]
-            winner_p99 = (
-                min(non_zero_p99, key=lambda x: x[1])[0] if non_zero_p99 else "N/A"
-            )
-            line = f"{'Latency P99 (ms)':<25}"
-            for _, r in matching_results:
-                line += f" {r.latency_p99_ms:<15.2f}"
-            line += f" {winner_p99:<10}\n"
-            f.write(line)
-
-            # Throughput (higher is better, if applicable)
-            if any(r.throughput_kbps > 0 for _, r in matching_results):
-                tp_values = [(name, r.throughput_kbps) for name, r in matching_results]
-                winner_tp = max(tp_values, key=lambda x: x[1])[0]
-                line = f"{'Throughput (kB/s)':<25}"
-                for _, r in matching_results:
-                    line += f" {r.throughput_kbps:<15.2f}"
-                line += f" {winner_tp:<10}\n"
-                f.write(line)
-
-            # Overall winner by ops/sec
-            f.write(
-                f"\n→ Fastest: {winner_ops} ({max(ops_values, key=lambda x: x[1])[1]:.2f} ops/s)\n"
+                for t in common_tests
+            ]
+            for _, d in by_name
+        ]
+    )  # shape (P, T, 5)
+
+    # Higher is better for ops/throughput; lower (but non-zero) for latency
+    winners_ops = np.argmax(arr[:, :, 0], axis=0)
+    lat_grid = np.where(arr[:, :, 1:4] > 0, arr[:, :, 1:4], np.inf)
+    winners_lat = np.argmin(lat_grid, axis=0)  # shape (T, 3)
+    winners_tp = np.argmax(arr[:, :, 4], axis=0)
+
+    # Assemble the report in memory and write it with one syscall
+    parts = []
+    parts.append("PROTOCOL COMPARISON REPORT\n")
+    parts.append("=" * 100 + "\n\n")
+    parts.append(f"Protocols Tested: {', '.join(protocol_names)}\n")
+    parts.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    parts.append("-" * 100 + "\n\n")
+
+    # Get all unique test names from first protocol (for the console summary)
+    first_protocol_results = valid_results[0][1]
+
+    metric_rows = [
+        ("Latency P50 (ms)", 1),
+        ("Latency P90 (ms)", 2),
+        ("Latency P99 (ms)", 3),
+    ]
+
+    # Row templates built once per report: the format spec is parsed a
+    # single time instead of once per cell
+    n_protocols = len(protocol_names)
+    header_row = ("%-25s" + " %-15s" * n_protocols + " %-10s\n") % (
+        "Metric",
+        *protocol_names,
+        "Winner",
+    )
+    row_fmt = "%-25s" + " %-15.2f" * n_protocols + " %-10s\n"
+
+    for j, test_name in enumerate(common_tests):
+        parts.append(f"Test: {test_name}\n")
+        parts.append("-" * 100 + "\n")
+        parts.append(header_row)
+        parts.append("-" * 100 + "\n")
+
+        # Operations per second (higher is better)
+        winner_ops = protocol_names[winners_ops[j]]
+        parts.append(row_fmt % ("Ops/sec", *arr[:, j, 0], winner_ops))
+
+        # Latency percentiles (lower is better, zeros excluded)
+        for label, m in metric_rows:
+            if np.isinf(lat_grid[:, j, m - 1]).all():
+                winner = "N/A"
+            else:
+                winner = protocol_names[winners_lat[j, m - 1]]
+            parts.append(row_fmt % (label, *arr[:, j, m], winner))
+
+        # Throughput (higher is better, if applicable)
+        if arr[:, j, 4].max() > 0:
+            parts.append(
+                row_fmt
+                % ("Throughput (kB/s)", *arr[:, j, 4], protocol_names[winners_tp[j]])
             )
-            f.write("\n" + "=" * 100 + "\n\n")
+
+        # Overall winner by ops/sec
+        parts.append(f"\n→ Fastest: {winner_ops} ({arr[:, j, 0].max():.2f} ops/s)\n")
+        parts.append("\n" + "=" * 100 + "\n\n")
+
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
 
     print(f"\n✓ Comparison report saved: {report_path}")
 
@@ -322,8 +293,8 @@ def generate_comparison_report(all_results: list, output_dir: str):
     for test_result in first_protocol_results:
         test_name = test_result.test_name
         ops_by_proto = []
-        for proto_name, proto_results in valid_results:
-            match = next((r for r in proto_results if r.test_name == test_name), None)
+        for proto_name, proto_by_name in by_name:
+            match = proto_by_name.get(test_name)
             if match:
                 ops_by_proto.append((proto_name, match.ops_per_second))
 
@@ -336,43 +307,66 @@ def generate_comparison_report(all_results: list, output_dir: str):
 
 def main():
     """Main benchmark execution for multiple protocols"""
+    import argparse
+
+    # Adapter factories, keyed by CLI name; constructed lazily so a
+    # deselected protocol never builds its client
+    available = {
+        "webapi": ("WebAPI", SpsWebApiAdapter),
+        "opcua": ("OPC UA", OpcUaAdapter),
+        "s7": ("S7", S7Adapter),
+    }
+
+    parser = argparse.ArgumentParser(description="SPS Multi-Protocol Benchmark Tool")
+    parser.add_argument(
+        "--protocols",
+        nargs="+",
+        choices=sorted(available),
+        default=list(available),
+        help="Protocols to benchmark (default: all)",
+    )
+    args = parser.parse_args()
+
+    adapters = [
+        (available[key][0], available[key][1]()) for key in args.protocols
+    ]
+
     print("SPS Multi-Protocol Benchmark Tool")
     print("=" * 60)
-    print("Testing: WebAPI, OPC UA, and S7\n")
+    print(f"Testing: {', '.join(name for name, _ in adapters)}\n")
 
     output_dir = "results_" + datetime.now().strftime("%Y%m%d_%H%M%S")
     os.makedirs(output_dir, exist_ok=True)
 
-    # Benchmark WebAPI
-    webapi_adapter = SpsWebApiAdapter()
-    webapi_results = run_benchmark_for_adapter("WebAPI", webapi_adapter, output_dir)
-
-    print("\n" + "=" * 60)
-    print("Pausing 2 seconds between protocols...")
-    print("=" * 60)
-    import time
-
-    time.sleep(2)
-
-    # Benchmark OPC UA
-    opcua_adapter = OpcUaAdapter()
-    opcua_results = run_benchmark_for_adapter("OPC UA", opcua_adapter, output_dir)
-
-    print("\n" + "=" * 60)
-    print("Pausing 2 seconds between protocols...")
-    print("=" * 60)
-    time.sleep(2)
-
-    # Benchmark S7
-    s7_adapter = S7Adapter()
-    s7_results = run_benchmark_for_adapter("S7", s7_adapter, output_dir)
-
-    # Generate comparison report with all protocols
-    all_results = [
-        ("WebAPI", webapi_results),
-        ("OPC UA", opcua_results),
-        ("S7", s7_results),
-    ]
+    if BENCHMARK_PARALLEL:
+        # Each adapter is I/O-bound on its own socket, so threads overlap
+        # the PLC round-trip idle time and wall-clock drops from the sum
+        # of the runs to roughly the longest one
+        from concurrent.futures import ThreadPoolExecutor
+
+        print("Running protocol benchmarks in parallel (BENCHMARK_PARALLEL=1)\n")
+        with ThreadPoolExecutor(max_workers=len(adapters)) as executor:
+            futures = [
+                executor.submit(run_benchmark_for_adapter, name, adapter, output_dir)
+                for name, adapter in adapters
+            ]
+            all_results = [
+                (name, future.result())
+                for (name, _), future in zip(adapters, futures)
+            ]
+    else:
+        import time
+
+        all_results = []
+        for i, (name, adapter) in enumerate(adapters):
+            if i > 0:
+                print("\n" + "=" * 60)
+                print("Pausing 2 seconds between protocols...")
+                print("=" * 60)
+                time.sleep(2)
+            all_results.append(
+                (name, run_benchmark_for_adapter(name, adapter, output_dir))
+            )
 
     generate_comparison_report(all_results, output_dir)
     generate_comparison_plots(all_results, output_dir)
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# The benchmark modules import each other by top-level name (they run as
+# scripts, not as an installed package), so make the project directory
+# importable for the tests too
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,56 @@
+"""Smoke test: one result must round-trip through the JSON-lines run log."""
+
+import numpy as np
+import orjson
+
+from benchmark_runner import BenchmarkResult, BenchmarkRunner, _percentiles
+
+
+def test_result_roundtrips_through_jsonl(tmp_path):
+    runner = BenchmarkRunner(adapter=None, raw_log_dir=str(tmp_path))
+
+    # Percentiles come from numpy; they must arrive as plain floats or
+    # orjson rejects the record
+    p50, p90, p99 = _percentiles(np.array([1.0, 2.0, 3.0]))
+    result = BenchmarkResult(
+        test_name="Write_bool_1ops",
+        total_operations=3,
+        duration_seconds=1.0,
+        ops_per_second=3.0,
+        latency_p50_ms=p50,
+        latency_p90_ms=p90,
+        latency_p99_ms=p99,
+    )
+
+    runner._record_result(result)
+
+    lines = (tmp_path / "results.jsonl").read_bytes().splitlines()
+    assert len(lines) == 1
+    record = orjson.loads(lines[0])
+    assert record["test_name"] == "Write_bool_1ops"
+    assert record["latency_p50_ms"] == 2.0
+    assert record["latency_p99_ms"] == 3.0
+
+
+def test_results_export_to_json(tmp_path):
+    runner = BenchmarkRunner(adapter=None)
+
+    p50, p90, p99 = _percentiles(np.array([1.0, 2.0, 3.0]))
+    runner.results.append(
+        BenchmarkResult(
+            test_name="Write_bool_1ops",
+            total_operations=3,
+            duration_seconds=1.0,
+            ops_per_second=3.0,
+            latency_p50_ms=p50,
+            latency_p90_ms=p90,
+            latency_p99_ms=p99,
+        )
+    )
+
+    path = tmp_path / "results.json"
+    runner.export_results_json(str(path))
+
+    records = orjson.loads(path.read_bytes())
+    assert len(records) == 1
+    assert records[0]["latency_p50_ms"] == 2.0